@@ -0,0 +1,217 @@
+"""
+Startup benchmark for the mysite WSGI and ASGI entry points.
+
+Each run starts a fresh Python process (like a newly scaled-up worker) and
+measures how long it takes to import mysite.wsgi / mysite.asgi, how long the
+first request takes, and the peak RSS of the process. Runs alternate between
+the lean mysite.settings_production profile and the default mysite.settings
+profile, and the best run of each is kept to cut scheduler noise.
+
+The budgets are relative: the script exits with status 1 if, for either
+entry point, the first request or RSS of the lean profile is not below the
+given fraction of the same metric for the default profile. Loading the
+admin, auth and session apps into the lean profile again makes the two
+profiles equal and fails. Import time is too noisy to gate on by default, so
+it is only reported unless --import-ratio is given.
+
+Usage:
+    python bench_startup.py
+    python bench_startup.py --runs 10
+    python bench_startup.py --request-ratio 0.6 --rss-ratio 0.95 --import-ratio 0.95
+
+To recalibrate after an intentional change to either profile, run the script
+with --runs 10 a few times, note the lowest ratios it prints for each metric,
+and set each default to about halfway between that ratio and 1.0.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+
+# Default budgets: the highest allowed lean / default ratio for each metric,
+# or None to only report it
+IMPORT_RATIO = None
+REQUEST_RATIO = 0.75
+RSS_RATIO = 0.98
+
+METRICS = ("import", "request", "rss")
+
+
+def peak_rss_mib():
+    """Return the peak resident set size of this process in MiB"""
+    import resource  # pylint: disable=import-outside-toplevel
+
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes everywhere else
+    if sys.platform == "darwin":
+        return maxrss / (1024 * 1024)
+    return maxrss / 1024
+
+
+def wsgi_request(application, path):
+    """Send a single GET request to a WSGI application and return the status code"""
+    from wsgiref.util import setup_testing_defaults  # pylint: disable=import-outside-toplevel
+
+    environ = {"PATH_INFO": path, "REQUEST_METHOD": "GET"}
+    setup_testing_defaults(environ)
+    status = []
+
+    def start_response(status_line, headers, exc_info=None):
+        status.append(int(status_line.split()[0]))
+
+    response = application(environ, start_response)
+    try:
+        for _ in response:
+            pass
+    finally:
+        if hasattr(response, "close"):
+            response.close()
+    return status[0]
+
+
+def asgi_request(application, path):
+    """Send a single GET request to an ASGI application and return the status code"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [(b"host", b"127.0.0.1")],
+        "client": ("127.0.0.1", 0),
+        "server": ("127.0.0.1", 80),
+    }
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+    status = []
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        # Django listens for a disconnect while the view runs; never send one
+        return await asyncio.Future()
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    asyncio.run(application(scope, receive, send))
+    return status[0]
+
+
+def child(entry_point, path):
+    """Measure a cold start in this process and print the results as JSON"""
+    start = time.perf_counter()
+    module = __import__(f"mysite.{entry_point}", fromlist=["application"])
+    imported = time.perf_counter()
+
+    if entry_point == "wsgi":
+        status = wsgi_request(module.application, path)
+    else:
+        status = asgi_request(module.application, path)
+    finished = time.perf_counter()
+
+    print(json.dumps({
+        "import": imported - start,
+        "request": finished - imported,
+        "rss": peak_rss_mib(),
+        "status": status,
+    }))
+
+
+def run_worker(entry_point, settings, path):
+    """Run the child benchmark in a fresh process and return its results"""
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings)
+    env.setdefault("DJANGO_SECRET_KEY", "startup-benchmark-only")
+    env.setdefault("DJANGO_ALLOWED_HOSTS", "127.0.0.1")
+    process = subprocess.run(
+        [sys.executable, __file__, "--child", entry_point, "--path", path],
+        cwd=BASE_DIR, env=env, capture_output=True, text=True, check=False,
+    )
+    if process.returncode:
+        raise SystemExit(
+            f"{settings} {entry_point}: worker failed to start\n{process.stderr}"
+        )
+    result = json.loads(process.stdout.strip().splitlines()[-1])
+    if result["status"] != 200:
+        raise SystemExit(f"{settings} {entry_point}: GET {path} returned {result['status']}")
+    return result
+
+
+def measure(entry_point, settings_modules, path, runs):
+    """Alternate runs between the settings modules and return the best result of each"""
+    results = {settings: [] for settings in settings_modules}
+    for _ in range(runs):
+        for settings in settings_modules:
+            results[settings].append(run_worker(entry_point, settings, path))
+
+    return {
+        settings: {key: min(result[key] for result in results[settings]) for key in METRICS}
+        for settings in settings_modules
+    }
+
+
+def main():
+    """Benchmark both entry points and fail if any budget is exceeded"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--settings", default="mysite.settings_production",
+                        help="settings module under test")
+    parser.add_argument("--reference", default="mysite.settings",
+                        help="settings module to compare against")
+    parser.add_argument("--path", default="/polls/", help="URL of the first request")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--import-ratio", type=float, default=IMPORT_RATIO)
+    parser.add_argument("--request-ratio", type=float, default=REQUEST_RATIO)
+    parser.add_argument("--rss-ratio", type=float, default=RSS_RATIO)
+    parser.add_argument("--child", choices=["wsgi", "asgi"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+
+    if args.child:
+        child(args.child, args.path)
+        return 0
+
+    budgets = {
+        "import": args.import_ratio,
+        "request": args.request_ratio,
+        "rss": args.rss_ratio,
+    }
+    units = {"import": "s", "request": "s", "rss": "MiB"}
+    failed = False
+
+    print(
+        f"settings: {args.settings}, reference: {args.reference}, "
+        f"first request: GET {args.path}, runs: {args.runs}"
+    )
+    for entry_point in ("wsgi", "asgi"):
+        best = measure(entry_point, (args.settings, args.reference), args.path, args.runs)
+        for key in METRICS:
+            value = best[args.settings][key]
+            reference = best[args.reference][key]
+            ratio = value / reference
+            if budgets[key] is None:
+                verdict = "(no budget)"
+            else:
+                over = ratio > budgets[key]
+                failed = failed or over
+                verdict = f"(budget {budgets[key]:g}) {'OVER BUDGET' if over else 'ok'}"
+            print(
+                f"mysite.{entry_point:<4} {key:<8} {value:8.3f} {units[key]:<3} "
+                f"vs {reference:8.3f} {units[key]:<3} ratio {ratio:.2f} {verdict}"
+            )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
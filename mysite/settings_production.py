@@ -0,0 +1,77 @@
+"""
+Production settings for mysite project.
+
+Builds on mysite.settings but only loads the apps and middleware the polls
+site needs to serve requests, so each worker starts faster and uses less
+memory. Select it with DJANGO_SETTINGS_MODULE=mysite.settings_production.
+
+See https://docs.djangoproject.com/en/5.1/howto/deployment/checklist/
+"""
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .settings import *  # noqa: F401,F403
+
+# SECURITY WARNING: keep the secret key used in production secret!
+SECRET_KEY = os.environ['DJANGO_SECRET_KEY']
+
+DEBUG = False
+
+# Comma-separated list of host names, e.g. "polls.example.com,www.example.com"
+ALLOWED_HOSTS = [
+    host.strip()
+    for host in os.environ['DJANGO_ALLOWED_HOSTS'].split(',')
+    if host.strip()
+]
+if not ALLOWED_HOSTS:
+    raise ImproperlyConfigured("DJANGO_ALLOWED_HOSTS must list at least one host.")
+
+
+# Application definition
+# The admin (and the auth, contenttypes and sessions apps it depends on)
+# is left out; use the development settings to manage content through /admin/.
+
+INSTALLED_APPS = [
+    "polls.apps.PollsConfig",
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+]
+
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+ROOT_URLCONF = 'mysite.urls_production'
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.request',
+                'django.contrib.messages.context_processors.messages',
+                'polls.context_processors.latest_questions',
+                'polls.context_processors.oldest_questions',
+                'polls.context_processors.popular_questions',
+                'polls.context_processors.all_questions',
+                'polls.context_processors.all_lists',
+                'polls.context_processors.specific_question_list',
+            ],
+        },
+    },
+]
+
+# No session middleware, so flash messages are kept in a signed cookie
+MESSAGE_STORAGE = 'django.contrib.messages.storage.cookie.CookieStorage'
+
+# The site must be served over HTTPS: browsers drop these cookies on plain
+# HTTP, which breaks CSRF checks on every form and the flash messages
+CSRF_COOKIE_SECURE = True
+SESSION_COOKIE_SECURE = True
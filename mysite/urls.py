@@ -20,5 +20,4 @@ from django.urls import include, path
 urlpatterns = [
     path("polls/", include("polls.urls")),
     path("admin/", admin.site.urls),
-    path("aria_music/", include("aria_music.urls")),
 ]
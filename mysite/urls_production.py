@@ -0,0 +1,11 @@
+"""
+URL configuration for mysite project in production.
+
+Only routes the polls app; the admin is not installed by
+mysite.settings_production.
+"""
+from django.urls import include, path
+
+urlpatterns = [
+    path("polls/", include("polls.urls")),
+]
@@ -3,10 +3,18 @@ Tests for the Polls App
 """
 
 import datetime
-from django.test import TestCase
+import importlib
+import os
+import sys
+from unittest import mock
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
 from django.utils import timezone
 
 from .models import Question
+
+
 # Create your tests here.
 class QuestionModelTests(TestCase):
     """Tests for Question Model"""
@@ -38,3 +46,84 @@ class QuestionModelTests(TestCase):
         time = timezone.now() - datetime.timedelta(hours=23, minutes=59, seconds=59)
         recent_question = Question(pub_date=time)
         self.assertIs(recent_question.was_published_recently(), True)
+
+
+def load_production_settings(**environ):
+    """
+    Import mysite.settings_production with the given environment variables,
+    reloading it so every call sees its own environment.
+    """
+    environ = {"DJANGO_SECRET_KEY": "test", "DJANGO_ALLOWED_HOSTS": "testserver", **environ}
+    with mock.patch.dict(os.environ, environ):
+        production = sys.modules.get("mysite.settings_production")
+        if production is None:
+            return importlib.import_module("mysite.settings_production")
+        return importlib.reload(production)
+
+
+def production_settings():
+    """Return the settings from mysite.settings_production that change runtime behavior"""
+    production = load_production_settings()
+    names = [
+        "ALLOWED_HOSTS",
+        "INSTALLED_APPS",
+        "MIDDLEWARE",
+        "ROOT_URLCONF",
+        "TEMPLATES",
+        "MESSAGE_STORAGE",
+        "CSRF_COOKIE_SECURE",
+        "SESSION_COOKIE_SECURE",
+    ]
+    return {name: getattr(production, name) for name in names}
+
+
+class ProductionAllowedHostsTests(SimpleTestCase):
+    """Tests for reading ALLOWED_HOSTS in mysite.settings_production"""
+    def test_allowed_hosts_are_stripped(self):
+        """
+        Whitespace around hosts is removed and empty entries are dropped.
+        """
+        production = load_production_settings(DJANGO_ALLOWED_HOSTS=" a.com, ,b.com ")
+        self.assertEqual(production.ALLOWED_HOSTS, ["a.com", "b.com"])
+
+
+    def test_no_allowed_hosts_is_an_error(self):
+        """
+        A DJANGO_ALLOWED_HOSTS value without any host raises ImproperlyConfigured.
+        """
+        with self.assertRaises(ImproperlyConfigured):
+            load_production_settings(DJANGO_ALLOWED_HOSTS=",")
+
+
+@override_settings(**production_settings())
+class ProductionSettingsTests(TestCase):
+    """Tests for the lean mysite.settings_production profile"""
+    def test_index_renders(self):
+        """
+        The polls index page renders without the admin, auth
+        and sessions apps installed.
+        """
+        response = self.client.get(reverse("polls:index"))
+        self.assertEqual(response.status_code, 200)
+
+
+    def test_admin_is_not_routed(self):
+        """
+        The admin is not installed, so /admin/ returns 404.
+        """
+        response = self.client.get("/admin/")
+        self.assertEqual(response.status_code, 404)
+
+
+    def test_add_question_shows_success_message(self):
+        """
+        Adding a question redirects to the index page and shows the
+        success message stored in the messages cookie.
+        """
+        response = self.client.post(reverse("polls:add_question"), {
+            "question_text": "Cats or dogs?",
+            "new_topic": "Pets",
+            "choice": ["Cats", "Dogs"],
+        }, follow=True)
+        self.assertRedirects(response, reverse("polls:index"))
+        self.assertContains(response, "Your question has been successfully added!")